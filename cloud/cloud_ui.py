@@ -11,26 +11,31 @@ from cloud_cal import (
     CO2_PER_TREE_PER_YEAR
 )
 
-st.set_page_config(
-    page_title="Green IT Decision Portal",
-    layout="wide"
-)
+# Page config belongs to main.py when this module is imported as a page;
+# only configure it when the file is run directly.
+if __name__ == "__main__":
+    st.set_page_config(
+        page_title="Green IT Decision Portal",
+        layout="wide"
+    )
 
 def render_metric_card(label, value, equivalent_text, equivalent_emoji, help_text=""):
-    st.markdown(f"""
+    st.html(f"""
         <div class="kpi-card">
             <div class="kpi-icon">{equivalent_emoji}</div>
             <div class="kpi-label">{label}</div>
             <div class="kpi-value">{value}</div>
             <div class="kpi-unit">~{equivalent_text}</div>
         </div>
-    """, unsafe_allow_html=True)
+    """)
 
-st.markdown("""
+# Emitted by render_cloud_section on every run; importing this module has no
+# UI side effects, so the cached module object can be reused across reruns.
+CLOUD_CSS = """
     <style>
     /* === LIGHT LUXURY BASE === */
     .stApp {
-        background: linear-gradient(160deg, #faf9f7 0%, #f5f3ef 50%, #faf9f7 100%);
+        background: #faf9f7;
     }
     
     /* Hide default Streamlit elements */
@@ -130,7 +135,7 @@ st.markdown("""
         transition: all 0.3s ease;
         position: relative;
         height: 100%;
-        margin-bottom: 15px;
+        margin: 24px 0 15px 0;
     }
     
     .kpi-card:hover {
@@ -248,7 +253,7 @@ st.markdown("""
         border-radius: 10px;
         border: 2px solid #ef4444; /* Distinct Red Rectangle */
         box-shadow: 0 4px 16px rgba(239, 68, 68, 0.1);
-        margin: 25px 0;
+        margin: 48px 0;
     }
 
     .urgent-alert-header {
@@ -282,6 +287,13 @@ st.markdown("""
         margin-bottom: 0;
     }
     
+    /* === VERTICAL RHYTHM (replaces <br> spacer blocks) === */
+    [data-testid="stHeading"],
+    [data-testid="stPlotlyChart"],
+    [data-testid="stCheckbox"] {
+        margin-top: 24px;
+    }
+    
     /* === DIVIDERS === */
     .gold-divider {
         height: 1px;
@@ -289,6 +301,12 @@ st.markdown("""
         margin: 50px 0;
     }
     
+    .section-divider {
+        height: 1px;
+        background: rgba(49, 51, 63, 0.2);
+        margin: 36px 0;
+    }
+    
     /* === CHART CONTAINER === */
     .chart-container {
         background: #fff;
@@ -349,7 +367,14 @@ st.markdown("""
         color: #555 !important;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+SECTION_DIVIDER = '<div class="section-divider"></div>'
+
+@st.cache_data(show_spinner=False)
+def cached_archival_strategy(storage_gb, reduction_target, data_growth_rate, carbon_intensity, projection_years):
+    """Memoised calculate_archival_strategy; inputs are plain scalars from the settings row."""
+    return calculate_archival_strategy(storage_gb, reduction_target, data_growth_rate, carbon_intensity, projection_years)
 
 def create_diverging_path_chart(archival_df, reduction_target):
     fig = go.Figure()
@@ -435,6 +460,7 @@ def create_diverging_path_chart(archival_df, reduction_target):
     
     return fig
 
+@st.fragment
 def run_cloud_optimizer():
     st.title("Cloud Storage Sustainability Advisor")
     st.write("Optimize your data center footprint through intelligent archival strategies.")
@@ -457,11 +483,9 @@ def run_cloud_optimizer():
     carbon_intensity = calculate_carbon_intensity(selected_providers)
     baseline = calculate_baseline_metrics(storage_gb, carbon_intensity)
 
-    st.divider()
-    st.markdown("<br>", unsafe_allow_html=True)
+    st.html(SECTION_DIVIDER)
     st.subheader("Current Annual Baseline")
     st.caption("These metrics show your current yearly impact before optimization.")
-    st.markdown("<br>", unsafe_allow_html=True)
     
     m1, m2, m3 = st.columns(3)
     with m1:
@@ -469,32 +493,28 @@ def run_cloud_optimizer():
     with m2:
         render_metric_card("Annual Water Usage", f"{baseline['water_liters']:,.0f} Liters", f"{baseline['showers']:,.0f} Showers", "🚿")
     with m3:
-        st.markdown(f"""<div class="kpi-card">
+        st.html(f"""<div class="kpi-card">
             <div class="kpi-icon">🎯</div>
             <div class="kpi-label">Efficiency Goal</div>
             <div class="kpi-value" style="color: #059669;">-{reduction_target}%</div>
             <div class="kpi-unit">Relative reduction vs growth</div>
-        </div>""", unsafe_allow_html=True)
-
-    st.markdown("<br><br>", unsafe_allow_html=True)
+        </div>""")
     
     # --- START OF RED RECTANGLE SECTION ---
-    archival_df = calculate_archival_strategy(storage_gb, reduction_target, data_growth_rate, carbon_intensity, projection_years)
+    archival_df = cached_archival_strategy(storage_gb, reduction_target, data_growth_rate, carbon_intensity, projection_years)
     year_1 = archival_df.iloc[0]
     
-    st.markdown(f"""
+    st.html(f"""
     <div class="urgent-alert">
         <div class="urgent-alert-header">🚨 Action Required Immediately</div>
         <h3>Immediate Intervention Required</h3>
         <p><b>CRITICAL:</b> Your emissions are directly tied to data growth. To maintain a sustainable <b>{reduction_target}%</b> efficiency gain, you must archive <b>{year_1['Data to Archive (TB)']:.1f} TB</b> 
         this year. In the table below, notice how <b>Emissions After Archival</b> now scale with your business growth, ensuring that your 'Hot' tier remains optimized rather than artificially capped.</p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
     # --- END OF RED RECTANGLE SECTION ---
 
-    st.markdown("<br><br>", unsafe_allow_html=True)
     st.subheader(f" Total {projection_years}-Year Environmental Gap")
-    st.markdown("<br>", unsafe_allow_html=True)
     
     cumulative = calculate_cumulative_savings(archival_df)
 
@@ -504,17 +524,15 @@ def run_cloud_optimizer():
     with k2:
         render_metric_card("Total Water Reclaimed", f"{cumulative['water_saved']:,.0f} Liters", f"{cumulative['showers_saved']:,.0f} Showers", "🚿")
     with k3:
-        st.markdown(f"""<div class="kpi-card">
+        st.html(f"""<div class="kpi-card">
             <div class="kpi-icon">💰</div>
             <div class="kpi-label">Total Financial ROI</div>
             <div class="kpi-value">€{cumulative['euro_saved']:,.0f}</div>
             <div class="kpi-unit">Avoided Costs over {projection_years}y</div>
-        </div>""", unsafe_allow_html=True)
+        </div>""")
 
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    st.write("###  Visual Impact Analysis")
+    st.subheader("Visual Impact Analysis")
     st.caption("Diverging path visualization showing the magnitude and urgency of action")
-    st.markdown("<br>", unsafe_allow_html=True)
 
     st.plotly_chart(
         create_diverging_path_chart(archival_df, reduction_target),
@@ -522,21 +540,16 @@ def run_cloud_optimizer():
         key="diverging_path"
     )
 
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    with st.expander("📊 View Technical Breakdown & Data Evolution"):
+    # A collapsed expander still builds the styled table on every rerun;
+    # a toggle lets us skip that work until the user asks for it.
+    if st.toggle("📊 View Technical Breakdown & Data Evolution", key="show_breakdown"):
         st.write("Detailed annualized metrics. Note how 'Emissions After Archival' increases relative to data growth, acknowledging business scaling.")
-        st.markdown("<br>", unsafe_allow_html=True)
         
-        cols_to_show = [
-            "Year", "Storage (TB)", "Data to Archive (TB)",
-            "Emissions w/o Archival (kg)", "Emissions After Archival (kg)", 
-            "Water Savings (L)", "Cost Savings (€)", "Meets Target"
-        ]
+        # calculate_archival_strategy already returns exactly the displayed
+        # columns in display order, so no column-subset copy is needed.
+        display_df = archival_df.assign(Year="Year " + archival_df["Year"].astype(str))
         
-        display_df = archival_df.copy()
-        display_df["Year"] = display_df["Year"].apply(lambda x: f"Year {x}")
-        
-        formatted_df = display_df[cols_to_show].style.format({
+        formatted_df = display_df.style.format({
             "Storage (TB)": "{:.2f}",
             "Data to Archive (TB)": "{:.2f}",
             "Emissions w/o Archival (kg)": "{:,.0f}",
@@ -547,9 +560,7 @@ def run_cloud_optimizer():
         
         st.dataframe(formatted_df, use_container_width=True, hide_index=True)
     
-    st.markdown("<br>", unsafe_allow_html=True)
-    st.divider()
-    st.markdown("<br>", unsafe_allow_html=True)
+    st.html(SECTION_DIVIDER)
     st.write("**Methodology & Calculation Logic**")
     st.write(f"""
         -  **Carbon Intensity:** Calculated at {carbon_intensity:.0f} gCO₂/kWh based on cloud region energy mix.
@@ -559,14 +570,15 @@ def run_cloud_optimizer():
     """)
 
 def render_cloud_section():
+    st.html(CLOUD_CSS)
     run_cloud_optimizer()
 
 def run():
-    run_cloud_optimizer()
+    render_cloud_section()
 
 if __name__ == "__main__":
     st.title("Élysia Cloud Solution")
     st.markdown("### Strategic decision-making model for a sustainable cloud storage.")
     
     st.divider()
-    run_cloud_optimizer()
+    render_cloud_section()
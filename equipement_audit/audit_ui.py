@@ -5,11 +5,14 @@ Steps 0-4: Welcome, Calibration, Shock, Hope, Strategy
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Any, Tuple
+import io
 import uuid
 import base64
 import os
+from dataclasses import dataclass, field
 from datetime import datetime
 
 # =============================================================================
@@ -30,6 +33,16 @@ except ImportError:
     def show_stranded_value_disclaimer(): st.caption("*Stranded value is theoretical - see methodology*")
     def render_methodology_tab(): st.info("Methodology documentation not available")
 
+# utils_ui is on the path when the page runs through main.py; on its own the
+# stylesheets are sent unminified.
+try:
+    from utils_ui import minify_css, logo_src
+except ImportError:
+    logo_src = None
+
+    def minify_css(css):
+        return css
+
 from calculator import SimpleROICalculator, SimpleROI
 
 try:
@@ -99,8 +112,8 @@ except ImportError:
 # =============================================================================
 
 def ui_key(step: str, name: str) -> str:
-    audit = st.session_state.get("audit", {})
-    session_id = audit.get("session_id", "default")[:8]
+    audit = st.session_state.get("audit")
+    session_id = getattr(audit, "session_id", "default")[:8]
     return f"{step}_{name}_{session_id}"
 
 
@@ -108,45 +121,49 @@ def ui_key(step: str, name: str) -> str:
 # SESSION STATE
 # =============================================================================
 
-def _get_audit_state() -> Dict[str, Any]:
+@dataclass(slots=True)
+class AuditState:
+    """Per-session audit state; fixed fields, so slots instead of a dict."""
+    session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    stage: str = "welcome"
+    fleet_size: int = 12500
+    refresh_cycle: int = 4
+    geo_code: str = "FR"
+    current_refurb_pct: float = 0.0
+    target_pct: int = -20
+    avg_age: float = 3.5
+    shock_result: Any = None
+    hope_result: Any = None
+    risk_appetite: str = "balanced"
+    all_strategies: Any = None
+    strategy_set: Any = None
+    selected_strategy_key: Optional[str] = None
+    selected_strategy: Any = None
+    fleet_data: Optional[pd.DataFrame] = None
+    fleet_file_id: Optional[str] = None
+    fleet_insights: Any = None
+    data_source: str = "estimates"
+    confidence: str = "MEDIUM"
+    device_categories: Any = None
+    device_policies: Any = None
+    policy_impact: Any = None
+    action_plan: Any = None
+
+def _get_audit_state() -> AuditState:
     if "audit" not in st.session_state:
         st.session_state["audit"] = _create_default_state()
     return st.session_state["audit"]
 
-def _create_default_state() -> Dict[str, Any]:
-    return {
-        "session_id": str(uuid.uuid4()),
-        "stage": "welcome",
-        "fleet_size": 12500,
-        "refresh_cycle": 4,
-        "geo_code": "FR",
-        "current_refurb_pct": 0.0,
-        "target_pct": -20,
-        "avg_age": 3.5,
-        "shock_result": None,
-        "hope_result": None,
-        "risk_appetite": "balanced",
-        "all_strategies": None,
-        "strategy_set": None,
-        "selected_strategy_key": None,
-        "selected_strategy": None,
-        "fleet_data": None,
-        "fleet_insights": None,
-        "data_source": "estimates",
-        "confidence": "MEDIUM",
-        "device_categories": None,
-        "device_policies": None,
-        "policy_impact": None,
-        "action_plan": None,
-    }
+def _create_default_state() -> AuditState:
+    return AuditState()
 
 def _s(key: str, default: Any = None) -> Any:
-    return _get_audit_state().get(key, default)
+    return getattr(_get_audit_state(), key, default)
 
 def _update(updates: Dict[str, Any]) -> None:
     state = _get_audit_state()
     for key, value in updates.items():
-        state[key] = value
+        setattr(state, key, value)
 
 def _reset_state() -> None:
     st.session_state["audit"] = _create_default_state()
@@ -155,6 +172,10 @@ def safe_goto(stage: str) -> None:
     _update({"stage": stage})
     st.rerun()
 
+def _goto(stage: str) -> None:
+    """Button on_click callback: runs before the click's own rerun, so no extra st.rerun() is needed."""
+    _update({"stage": stage})
+
 def _sanity_check_backend() -> Tuple[bool, List[str]]:
     errors = []
     if not _BACKEND_READY:
@@ -166,22 +187,34 @@ def _sanity_check_backend() -> Tuple[bool, List[str]]:
 # LOGO - ONLY ICON
 # =============================================================================
 
-def _get_logo_base64(logo_path: str) -> Optional[str]:
-    for path in [logo_path, "logo.png/elysia_logo.png", "logo.png/elysia_icon.png", "elysia_logo.png", "logo.png", "/workspaces/green_it_project/logo.png/elysia_logo.png"]:
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_LOGO_CANDIDATES = (
+    os.path.join(_REPO_ROOT, "static", "elysia_logo.png"),
+    os.path.join(_REPO_ROOT, "logo.png", "elysia_icon.png"),
+)
+
+def _get_logo_base64() -> Optional[str]:
+    for path in _LOGO_CANDIDATES:
         if os.path.exists(path):
             try:
                 with open(path, "rb") as f:
-                    return base64.b64encode(f.read()).decode()
+                    return base64.b64encode(f.read()).decode("ascii")
             except Exception:
                 continue
     return None
 
+@st.cache_data(show_spinner=False)
 def _get_logo_html(size: str = "medium") -> str:
+    """Logo markup per size; cached so the PNG is read and encoded once, not on every rerun."""
     sizes = {"small": "48px", "medium": "80px", "large": "100px", "hero": "140px"}
     icon_size = sizes.get(size, sizes["medium"])
-    logo_b64 = _get_logo_base64("logo.png/elysia_logo.png")
-    if logo_b64:
-        return f'<div style="display:flex; align-items:center; justify-content:center;"><img src="data:image/png;base64,{logo_b64}" style="height:{icon_size}; width:auto;" alt="Élysia"/></div>'
+    # Same source as the homepage logo: the cacheable static URL when it is served
+    src = logo_src() if logo_src else None
+    if src is None:
+        logo_b64 = _get_logo_base64()
+        src = f"data:image/png;base64,{logo_b64}" if logo_b64 else None
+    if src:
+        return f'<div style="display:flex; align-items:center; justify-content:center;"><img src="{src}" style="height:{icon_size}; width:auto;" alt="Élysia"/></div>'
     # Text fallback with elegant styling
     font_size = {"small": "1.5rem", "medium": "2.5rem", "large": "3rem", "hero": "4rem"}.get(size, "2.5rem")
     return f'<div style="text-align:center;"><span style="font-family:\'Playfair Display\',Georgia,serif; font-size:{font_size}; font-weight:500; color:#8a6c4a; letter-spacing:0.08em;">Élysia</span></div>'
@@ -191,7 +224,7 @@ def _get_logo_html(size: str = "medium") -> str:
 # CSS
 # =============================================================================
 
-LUXURY_CSS = """
+LUXURY_CSS = minify_css("""
 <style>
 @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
 @import url('https://fonts.googleapis.com/css2?family=Material+Symbols+Rounded:opsz,wght,FILL,GRAD@20..48,400,0,0');
@@ -985,6 +1018,27 @@ div[data-testid="stExpander"] summary:hover {
     font-family: 'Inter', sans-serif !important;
 }
 
+/* HTML metric strip (same look as st.metric, one element for the whole row) */
+.metric-strip {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 1rem;
+    margin: 0.5rem 0 1.5rem 0;
+}
+
+.metric-strip-label {
+    font-size: 0.75rem;
+    font-weight: 400;
+    color: var(--text-mid);
+}
+
+.metric-strip-value {
+    font-size: 1.8rem;
+    font-weight: 300;
+    color: var(--text-dark);
+    letter-spacing: -0.02em;
+}
+
 /* ============================================
    LEGEND
    ============================================ */
@@ -1063,7 +1117,7 @@ div[data-testid="stExpander"] details > summary:hover {
 }
 
 </style>
-"""
+""")
 
 
 
@@ -1086,16 +1140,37 @@ def fmt_time(months: int) -> str:
 def _get_geo_options() -> Dict[str, str]:
     return {k: v.get("name", k) if isinstance(v, dict) else k for k, v in GRID_CARBON_FACTORS.items()}
 
+# Columns the audit reads from a fleet file (incl. the aliases normalization renames)
+_FLEET_CSV_COLUMNS = ("Device_Model", "Model", "Age_Years", "Age", "Persona", "Country")
+
+@st.cache_data(show_spinner=False)
+def _read_fleet_csv(data: bytes) -> pd.DataFrame:
+    """Parse an uploaded fleet CSV once per distinct file content."""
+    # Asset exports carry many unrelated columns; only parse the ones we use.
+    header = pd.read_csv(io.BytesIO(data), nrows=0).columns
+    usecols = [c for c in header if c in _FLEET_CSV_COLUMNS] or None
+    try:
+        # Multi-threaded Arrow parser; pyarrow already ships with Streamlit.
+        return pd.read_csv(io.BytesIO(data), engine="pyarrow", usecols=usecols)
+    except ValueError:
+        # Arrow rejects ragged rows the C parser tolerates; keep accepting them.
+        return pd.read_csv(io.BytesIO(data), usecols=usecols)
+
+@st.cache_resource(show_spinner=False)
+def _demo_fleet(n: int = 150) -> pd.DataFrame:
+    """Seeded demo fleet, identical for every user: built once per process and shared read-only."""
+    return generate_demo_fleet_extended(n) if _EXTENSIONS_READY else pd.DataFrame()
+
 
 # =============================================================================
 # COMPONENTS
 # =============================================================================
 
 def render_header():
-    st.markdown(f'<div class="lux-header">{_get_logo_html("medium")}<div class="lux-header-sub">Sustainable IT Intelligence · LVMH</div></div>', unsafe_allow_html=True)
+    st.html(f'<div class="lux-header">{_get_logo_html("medium")}<div class="lux-header-sub">Sustainable IT Intelligence · LVMH</div></div>')
 
 def render_step_badge(step: int, title: str):
-    st.markdown(f'<div style="text-align:center;"><span class="step-badge">STEP {step} · {title}</span></div>', unsafe_allow_html=True)
+    st.html(f'<div style="text-align:center;"><span class="step-badge">STEP {step} · {title}</span></div>')
 
 def render_progress(current: int, total: int = 7):
     dots = []
@@ -1104,10 +1179,14 @@ def render_progress(current: int, total: int = 7):
         dots.append(f'<div class="progress-dot {dot_class}"></div>')
         if i < total - 1:
             dots.append(f'<div class="progress-line {"completed" if i < current else ""}"></div>')
-    st.markdown(f'<div class="progress-container">{"".join(dots)}</div>', unsafe_allow_html=True)
+    st.html(f'<div class="progress-container">{"".join(dots)}</div>')
+
+def render_metric_strip(metrics: List[Tuple[str, str]]):
+    items = "".join(f'<div><div class="metric-strip-label">{label}</div><div class="metric-strip-value">{value}</div></div>' for label, value in metrics)
+    st.html(f'<div class="metric-strip">{items}</div>')
 
 def render_strategy_legend():
-    st.markdown('<div class="legend-box"><div class="legend-title">Understanding Strategy Types</div><div class="legend-items"><div class="legend-item"><strong>Recommended</strong> = Best balance of feasibility and impact</div><div class="legend-item"><strong>Conservative</strong> = Lower risk, proven approach</div><div class="legend-item"><strong>Ambitious</strong> = Maximum impact, higher effort</div></div></div>', unsafe_allow_html=True)
+    st.html('<div class="legend-box"><div class="legend-title">Understanding Strategy Types</div><div class="legend-items"><div class="legend-item"><strong>Recommended</strong> = Best balance of feasibility and impact</div><div class="legend-item"><strong>Conservative</strong> = Lower risk, proven approach</div><div class="legend-item"><strong>Ambitious</strong> = Maximum impact, higher effort</div></div></div>')
 
 
 # =============================================================================
@@ -1115,21 +1194,19 @@ def render_strategy_legend():
 # =============================================================================
 
 def render_welcome():
-    st.markdown(f'''<div class="hero-container">
+    st.html(f'''<div class="hero-container">
         {_get_logo_html("hero")}
         <div class="hero-slogan">Where Insight Drives Impact</div>
         <div class="hero-tagline">Reduce your IT fleet's carbon footprint by <strong>30-50%</strong><br>while cutting procurement costs.</div>
         <div class="hero-subtitle">Data-driven sustainable IT strategy, powered by LVMH LIFE 360 methodology.</div>
-    </div>''', unsafe_allow_html=True)
+    </div>''')
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("Begin Your Analysis", key=ui_key("welcome", "begin"), use_container_width=True):
-            safe_goto("calibration")
-        st.markdown("<p style='text-align:center; font-size:0.8rem; color:#9A958E; margin:1rem 0;'>— or —</p>", unsafe_allow_html=True)
-        if st.button("I have fleet data - Skip to Upload", key=ui_key("welcome", "skip"), use_container_width=True):
-            _update({"fleet_size": 12500})  # Default medium fleet
-            safe_goto("upload")
-    st.markdown('<div class="hero-trust">Trusted by LVMH Maisons · Backed by Industry Research</div>', unsafe_allow_html=True)
+        st.button("Begin Your Analysis", key=ui_key("welcome", "begin"), use_container_width=True, on_click=_goto, args=("calibration",))
+        st.html("<p style='text-align:center; font-size:0.8rem; color:#9A958E; margin:1rem 0;'>— or —</p>")
+        st.button("I have fleet data - Skip to Upload", key=ui_key("welcome", "skip"), use_container_width=True,
+                  on_click=_update, args=({"fleet_size": 12500, "stage": "upload"},))  # Default medium fleet
+    st.html('<div class="hero-trust">Trusted by LVMH Maisons · Backed by Industry Research</div>')
 
 
 # =============================================================================
@@ -1140,8 +1217,8 @@ def render_calibration():
     render_header()
     render_progress(0)
     render_step_badge(1, "CALIBRATION")
-    st.markdown("<h2 style='text-align:center; font-size: 2.4rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.01em;'>Calibrate Your Baseline</h2>", unsafe_allow_html=True)
-    st.markdown("<p style='text-align:center; color:#6B6560;'>Answer a few questions to personalize your analysis.</p>", unsafe_allow_html=True)
+    st.html("<h2 style='text-align:center; font-size: 2.4rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.01em;'>Calibrate Your Baseline</h2>")
+    st.html("<p style='text-align:center; color:#6B6560;'>Answer a few questions to personalize your analysis.</p>")
     geo_options = _get_geo_options()
     refresh_map = {"20": 5, "25": 4, "30": 3}
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -1187,13 +1264,13 @@ def render_shock():
     shock = ShockCalculator.calculate(fleet_size=fleet_size, avg_age=3.5, refresh_cycle=refresh_cycle, target_pct=target_pct, geo_code=geo_code, current_refurb_pct=current_refurb)
     _update({"shock_result": shock})
     
-    st.markdown("<h2 style='text-align:center; font-size: 2.4rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.01em;font-family: Inter, sans-serif; font-weight: 300; color: #1a1a1a; font-size: 2rem;'>If you do nothing...</h2>", unsafe_allow_html=True)
+    st.html("<h2 style='text-align:center; font-size: 2.4rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.01em;font-family: Inter, sans-serif; font-weight: 300; color: #1a1a1a; font-size: 2rem;'>If you do nothing...</h2>")
     
     col1, col2, col3 = st.columns(3)
     sc, cc = shock.stranded_calculation, shock.co2_calculation
     
     with col1:
-        st.markdown(f'''
+        st.html(f'''
         <div style="background: #FFFFFF; border: 0.5px solid #E8E6E0; border-radius: 16px; padding: 2rem 1.5rem; text-align: center; height: 100%;">
             <div style="font-family: Inter, sans-serif; font-size: 2.5rem; font-weight: 300; color: #8a6c4a; margin-bottom: 0.5rem; letter-spacing: -0.02em;">{fmt_currency(shock.stranded_value_eur)}</div>
             <div style="font-family: Inter, sans-serif; font-size: 0.8rem; color: #6B6560; font-weight: 400;">stranded in aging devices</div>
@@ -1207,10 +1284,10 @@ def render_shock():
                 <div style="font-family: Inter, sans-serif; font-size: 0.65rem; font-style: italic; color: #9A958E; margin-top: 0.5rem;">Source: Gartner IT Asset Depreciation 2023</div>
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     
     with col2:
-        st.markdown(f'''
+        st.html(f'''
         <div style="background: #FFFFFF; border: 0.5px solid #E8E6E0; border-radius: 16px; padding: 2rem 1.5rem; text-align: center; height: 100%;">
             <div style="font-family: Inter, sans-serif; font-size: 2.5rem; font-weight: 300; color: #8a6c4a; margin-bottom: 0.5rem; letter-spacing: -0.02em;">{shock.avoidable_co2_tonnes:,.0f}t</div>
             <div style="font-family: Inter, sans-serif; font-size: 0.8rem; color: #6B6560; font-weight: 400;">avoidable CO2 / year</div>
@@ -1224,10 +1301,10 @@ def render_shock():
                 <div style="font-family: Inter, sans-serif; font-size: 0.65rem; font-style: italic; color: #9A958E; margin-top: 0.5rem;">Source: Dell Circular Economy Report 2023</div>
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     
     with col3:
-        st.markdown(f'''
+        st.html(f'''
         <div style="background: #FFFFFF; border: 0.5px solid #E8E6E0; border-radius: 16px; padding: 2rem 1.5rem; text-align: center; height: 100%;">
             <div style="font-family: Inter, sans-serif; font-size: 2.5rem; font-weight: 300; color: #9E4A4A; margin-bottom: 0.5rem; letter-spacing: -0.02em;">2026</div>
             <div style="font-family: Inter, sans-serif; font-size: 0.8rem; color: #6B6560; font-weight: 400;">LIFE 360 deadline at risk</div>
@@ -1240,14 +1317,13 @@ def render_shock():
                 <div style="font-family: Inter, sans-serif; font-size: 0.65rem; font-style: italic; color: #9A958E; margin-top: 0.5rem;">Source: LVMH LIFE 360 Program</div>
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     
     show_stranded_value_disclaimer()
     
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
-        if st.button("What Can I Do?", key=ui_key("shock", "next"), use_container_width=True):
-            safe_goto("hope")
+        st.button("What Can I Do?", key=ui_key("shock", "next"), use_container_width=True, on_click=_goto, args=("hope",))
 
 
 # =============================================================================
@@ -1268,12 +1344,12 @@ def render_hope():
     _update({"hope_result": hope})
     
     # Title
-    st.markdown("<h2 style='text-align:center; font-size: 2.4rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.01em; font-family: Inter, sans-serif; font-weight: 300; color: #1a1a1a; font-size: 2rem;'>But there's another path...</h2>", unsafe_allow_html=True)
+    st.html("<h2 style='text-align:center; font-size: 2.4rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.01em; font-family: Inter, sans-serif; font-weight: 300; color: #1a1a1a; font-size: 2rem;'>But there's another path...</h2>")
     
     # Comparison cards with INLINE STYLES
     col1, col2, col3 = st.columns([5, 1, 5])
     with col1:
-        st.markdown(f'''
+        st.html(f'''
         <div style="border: 1px solid #9E4A4A; border-radius: 16px; padding: 2rem 1.5rem; text-align: center; background: linear-gradient(135deg, #FFF8F8 0%, #FFF5F5 100%);">
             <span style="display: inline-block; font-family: Inter, sans-serif; font-size: 0.55rem; font-weight: 600; letter-spacing: 0.12em; text-transform: uppercase; padding: 0.35rem 0.9rem; border-radius: 20px; background: #9E4A4A; color: white; margin-bottom: 1rem;">CURRENT TRAJECTORY</span>
             <div style="font-family: Inter, sans-serif; font-size: 2.5rem; font-weight: 300; color: #1a1a1a; margin: 0.5rem 0; letter-spacing: -0.02em;">{hope.current_co2_tonnes:,.0f}t</div>
@@ -1282,11 +1358,11 @@ def render_hope():
             <div style="font-family: Inter, sans-serif; font-size: 2.5rem; font-weight: 300; color: #1a1a1a; margin: 0.5rem 0; letter-spacing: -0.02em;">{fmt_currency(hope.current_cost_eur)}</div>
             <div style="font-family: Inter, sans-serif; font-size: 0.75rem; color: #6B6560; font-weight: 400;">Annual cost</div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     with col2:
-        st.markdown('<div style="display: flex; align-items: center; justify-content: center; height: 100%; font-size: 2rem; color: #9A958E; font-weight: 300;">→</div>', unsafe_allow_html=True)
+        st.html('<div style="display: flex; align-items: center; justify-content: center; height: 100%; font-size: 2rem; color: #9A958E; font-weight: 300;">→</div>')
     with col3:
-        st.markdown(f'''
+        st.html(f'''
         <div style="border: 1px solid #4A7C59; border-radius: 16px; padding: 2rem 1.5rem; text-align: center; background: linear-gradient(135deg, #F8FBF8 0%, #F5FAF5 100%);">
             <span style="display: inline-block; font-family: Inter, sans-serif; font-size: 0.55rem; font-weight: 600; letter-spacing: 0.12em; text-transform: uppercase; padding: 0.35rem 0.9rem; border-radius: 20px; background: #4A7C59; color: white; margin-bottom: 1rem;">WITH ÉLYSIA</span>
             <div style="font-family: Inter, sans-serif; font-size: 2.5rem; font-weight: 300; color: #1a1a1a; margin: 0.5rem 0; letter-spacing: -0.02em;">{hope.target_co2_tonnes:,.0f}t</div>
@@ -1295,12 +1371,12 @@ def render_hope():
             <div style="font-family: Inter, sans-serif; font-size: 2.5rem; font-weight: 300; color: #1a1a1a; margin: 0.5rem 0; letter-spacing: -0.02em;">{fmt_currency(hope.target_cost_eur)}</div>
             <div style="font-family: Inter, sans-serif; font-size: 0.75rem; color: #6B6560; font-weight: 400;">Annual cost</div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     
     # Stats row with INLINE STYLES
     time_text = fmt_time(hope.months_to_target)
     annual_savings = hope.current_cost_eur - hope.target_cost_eur
-    st.markdown(f'''
+    st.html(f'''
     <div style="display: flex; justify-content: center; gap: 5rem; margin: 3rem 0; padding: 2rem 0; flex-wrap: wrap;">
         <div style="text-align: center;">
             <div style="font-family: Inter, sans-serif; font-size: 2.5rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.02em;">-{abs(hope.co2_reduction_pct):.0f}%</div>
@@ -1315,7 +1391,7 @@ def render_hope():
             <div style="font-family: Inter, sans-serif; font-size: 0.65rem; color: #9A958E; text-transform: uppercase; letter-spacing: 0.12em; margin-top: 0.5rem; font-weight: 500;">TIME TO TARGET</div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    ''')
     
     # Financial Potential section
     try:
@@ -1324,7 +1400,7 @@ def render_hope():
         ROI_AVAILABLE = False
 
     if ROI_AVAILABLE:
-        st.markdown("<hr style='border: none; border-top: 0.5px solid #E8E6E0; margin: 2rem 0;'>", unsafe_allow_html=True)
+        st.html("<hr style='border: none; border-top: 0.5px solid #E8E6E0; margin: 2rem 0;'>")
         
         hope_refurb_rate = hope.calculation_details.get("strategy", {}).get("refurb_rate", 0.40)
         
@@ -1335,7 +1411,7 @@ def render_hope():
             current_refurb_rate=current_refurb,
         )
         
-        st.markdown(f'''
+        st.html(f'''
         <div style="background: #FFFFFF; border: 0.5px solid #E8E6E0; border-radius: 16px; padding: 2rem; margin: 1.5rem 0;">
             <div style="font-family: Inter, sans-serif; font-size: 1rem; font-weight: 500; color: #1a1a1a; text-align: center; margin-bottom: 2rem;">Financial Potential</div>
             <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 2rem;">
@@ -1349,7 +1425,7 @@ def render_hope():
                 </div>
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
         
         with st.expander(" ▼ How we estimate these savings"):
             st.markdown(f"""
@@ -1361,17 +1437,27 @@ def render_hope():
             """)
 
     # Navigation button
-    st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
+    st.html("<div style='height: 1rem;'></div>")
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
-        if st.button("Build My Strategy", key=ui_key("hope", "next"), use_container_width=True):
-            safe_goto("strategy")
+        st.button("Build My Strategy", key=ui_key("hope", "next"), use_container_width=True, on_click=_goto, args=("strategy",))
 
 
 # =============================================================================
 # STEP 4: STRATEGY SELECTION
 # =============================================================================
 
+# Static tail of the methodology expander, appended to its single markdown call.
+_STRATEGY_SOURCES_MD = """
+---
+
+#### Data Sources
+
+- **Hardware Pricing**: Gartner IT Asset Management Report 2023
+- **Environmental Data**: GHG Protocol Scope 3, Dell Circular Economy Report 2023
+- **Grid Carbon Factors**: IEA 2023
+"""
+
 def render_strategy():
     render_header()
     render_progress(3)
@@ -1385,7 +1471,7 @@ def render_strategy():
     results_all = StrategySimulator.compare_all_strategies(fleet_size=fleet_size, current_refresh=refresh_cycle, avg_age=3.5, target_pct=target_pct, geo_code=geo_code, data_mode="estimated")
     _update({"all_strategies": results_all})
     
-    st.markdown("<h3 style='text-align:center;'>Your Risk Appetite</h3>", unsafe_allow_html=True)
+    st.html("<h3 style='text-align:center;'>Your Risk Appetite</h3>")
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
@@ -1436,7 +1522,7 @@ def render_strategy():
             desc = strat.description[:80] + "..." if strat.description and len(strat.description) > 80 else (strat.description or "")
             time_text = fmt_time(strat.time_to_target_months)
             
-            st.markdown(f'''<div class="{card_class}">
+            st.html(f'''<div class="{card_class}">
                 <div class="strategy-card-title">{strat.strategy_name}</div>
                 <div class="strategy-card-desc">{desc}</div>
                 <div class="strategy-metrics">
@@ -1459,14 +1545,13 @@ def render_strategy():
                 </div>
                 <span class="strategy-risk {risk_class}">{risk_text}</span>
                 <div class="strategy-why">{explanations.get(card_type, "")}</div>
-            </div>''', unsafe_allow_html=True)
+            </div>''')
             
-            if st.button("Select", key=ui_key("strategy", f"sel_{card_type}"), use_container_width=True):
-                _update({"selected_strategy_key": strat.strategy_key, "selected_strategy": strat})
-                safe_goto("upload")
+            st.button("Select", key=ui_key("strategy", f"sel_{card_type}"), use_container_width=True,
+                      on_click=_update, args=({"selected_strategy_key": strat.strategy_key, "selected_strategy": strat, "stage": "upload"},))
     
     # Full comparison table
-    st.markdown("<h3 style='text-align:center; margin-top:2rem;'>Full Strategy Comparison</h3>", unsafe_allow_html=True)
+    st.html("<h3 style='text-align:center; margin-top:2rem;'>Full Strategy Comparison</h3>")
     comp_data = []
     for r in sorted(results_all, key=lambda x: (not x.reaches_target, -abs(x.co2_reduction_pct))):
         comp_data.append({
@@ -1485,9 +1570,9 @@ def render_strategy():
 
 __all__ = [
     # State management
-    "ui_key", "_get_audit_state", "_create_default_state", "_s", "_update", "_reset_state", "safe_goto", "_sanity_check_backend",
+    "ui_key", "AuditState", "_get_audit_state", "_create_default_state", "_s", "_update", "_reset_state", "safe_goto", "_goto", "_sanity_check_backend",
     # Components
-    "render_header", "render_step_badge", "render_progress", "render_strategy_legend",
+    "render_header", "render_step_badge", "render_progress", "render_metric_strip", "render_strategy_legend",
     "_get_logo_html", "fmt_currency", "fmt_time", "_get_geo_options",
     # CSS
     "LUXURY_CSS",
@@ -1501,7 +1586,7 @@ __all__ = [
 # ADDITIONAL CSS FOR PART 2
 # =============================================================================
 
-PART2_CSS = """
+PART2_CSS = minify_css("""
 <style>
 /* ============================================
    PART 2 CSS - UNIFIED WITH INTER TYPOGRAPHY
@@ -1546,7 +1631,7 @@ PART2_CSS = """
 .roi-card-value { font-size: 2rem; font-weight: 300; color: var(--success); margin-bottom: 0.5rem; letter-spacing: -0.02em; }
 .roi-card-label { font-size: 0.75rem; color: var(--text-mid); }
 </style>
-"""
+""")
 
 
 # =============================================================================
@@ -1557,8 +1642,8 @@ def render_upload():
     render_header()
     render_progress(4)
     render_step_badge(5, "UPLOAD DATA")
-    st.markdown("<h2 style='text-align:center; font-size: 2.4rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.01em;'>Increase Your Confidence</h2>", unsafe_allow_html=True)
-    st.markdown("<p style='text-align:center; color:#6B6560;'>Upload fleet data for precise, board-ready recommendations.</p>", unsafe_allow_html=True)
+    st.html("<h2 style='text-align:center; font-size: 2.4rem; font-weight: 300; color: #1a1a1a; letter-spacing: -0.01em;'>Increase Your Confidence</h2>")
+    st.html("<p style='text-align:center; color:#6B6560;'>Upload fleet data for precise, board-ready recommendations.</p>")
     
     # Ensure strategy is set
     if not _s("selected_strategy"):
@@ -1589,14 +1674,13 @@ def render_upload():
     with col3:
         st.markdown("**Try Demo Data**")
         if st.button("Load Demo Fleet", key=ui_key("upload", "demo"), use_container_width=True):
-            demo_df = generate_demo_fleet_extended(150) if _EXTENSIONS_READY else pd.DataFrame()
-            _update({"fleet_data": demo_df, "data_source": "uploaded"})
+            _update({"fleet_data": _demo_fleet(150), "data_source": "uploaded"})
             st.rerun()
     
-    if uploaded:
+    # The uploader keeps its file across reruns; only parse when a new file arrives.
+    if uploaded and uploaded.file_id != _s("fleet_file_id"):
         try:
-            _update({"fleet_data": pd.read_csv(uploaded), "data_source": "uploaded"})
-            st.rerun()
+            _update({"fleet_data": _read_fleet_csv(uploaded.getvalue()), "data_source": "uploaded", "fleet_file_id": uploaded.file_id})
         except Exception as e:
             st.error(f"Error reading file: {e}")
     
@@ -1630,15 +1714,16 @@ def render_upload():
                 refurb_eligible = summary.get("devices_refurb_eligible", fleet_size)
                 refurb_pct = summary.get("refurb_eligible_share", 1.0) * 100
                 
-                c1, c2, c3, c4 = st.columns(4)
-                c1.metric("Fleet Size", f"{fleet_size:,}")
-                c2.metric("Avg Age", f"{avg_age:.1f} years")
-                c3.metric("At Risk (>4yr)", f"{at_risk_pct:.0f}%")
-                c4.metric("Refurb Eligible", f"{refurb_pct:.0f}%")
+                render_metric_strip([
+                    ("Fleet Size", f"{fleet_size:,}"),
+                    ("Avg Age", f"{avg_age:.1f} years"),
+                    ("At Risk (>4yr)", f"{at_risk_pct:.0f}%"),
+                    ("Refurb Eligible", f"{refurb_pct:.0f}%"),
+                ])
                 
                 # Dynamic Key Insights
                 st.markdown("### Key Insights")
-                st.markdown(PART2_CSS, unsafe_allow_html=True)
+                st.html(PART2_CSS)
                 
                 # Build insight cards from dynamic data
                 insight_cards_html = '<div class="insight-grid">'
@@ -1651,18 +1736,23 @@ def render_upload():
                         <div class="insight-value" style="color: {severity_color};">{insight.calculation.result}</div>
                     </div>'''
                 insight_cards_html += '</div>'
-                st.markdown(insight_cards_html, unsafe_allow_html=True)
+                st.html(insight_cards_html)
                 
-                # Calculation proofs in dropdown
+                # Calculation proofs in dropdown, assembled into one markdown block
                 with st.expander(" ▼ View calculation details"):
+                    proofs = []
                     for insight in insights_result.insights:
-                        st.markdown(f"**{insight.title}**")
-                        st.markdown(f"- Formula: {insight.calculation.formula}")
-                        st.markdown(f"- Inputs: {insight.calculation.inputs}")
-                        st.markdown(f"- Result: {insight.calculation.result}")
-                        if insight.calculation.source:
-                            st.caption(f"Source: {insight.calculation.source}")
-                        st.markdown("---")
+                        calc = insight.calculation
+                        proof = (
+                            f"**{insight.title}**\n\n"
+                            f"- Formula: {calc.formula}\n"
+                            f"- Inputs: {calc.inputs}\n"
+                            f"- Result: {calc.result}"
+                        )
+                        if calc.source:
+                            proof += f"\n\n:gray[Source: {calc.source}]"
+                        proofs.append(proof)
+                    st.markdown("\n\n---\n\n".join(proofs) + "\n\n---")
                 
                 # Store insights for action plan
                 _update({"fleet_insights": insights_result})
@@ -1679,19 +1769,18 @@ def render_upload():
     # Navigation
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("Back", key=ui_key("upload", "back")):
-            safe_goto("strategy")
+        st.button("Back", key=ui_key("upload", "back"), on_click=_goto, args=("strategy",))
     with col2:
         btn_text = "Continue with Fleet Data" if df is not None else "Skip - Use Estimates"
-        if st.button(btn_text, key=ui_key("upload", "next"), use_container_width=True):
-            safe_goto("simulator")
+        st.button(btn_text, key=ui_key("upload", "next"), use_container_width=True, on_click=_goto, args=("simulator",))
 
 
 def _render_basic_upload_summary(df):
     """Fallback basic summary when advanced insights unavailable."""
     fleet_size = len(df)
-    avg_age = df["Age_Years"].mean() if "Age_Years" in df.columns else 3.5
-    at_risk = (df["Age_Years"] >= 4).sum() if "Age_Years" in df.columns else int(fleet_size * 0.3)
+    ages = df["Age_Years"].to_numpy() if "Age_Years" in df.columns else None
+    avg_age = df["Age_Years"].mean() if ages is not None else 3.5
+    at_risk = int(np.count_nonzero(ages >= 4)) if ages is not None else int(fleet_size * 0.3)
     at_risk_pct = at_risk / fleet_size * 100 if fleet_size > 0 else 0
     
     # Get constants from calculator or use defaults
@@ -1710,14 +1799,15 @@ def _render_basic_upload_summary(df):
     target_refurb_rate = 0.40  # Default strategy assumption
     
     st.markdown("### Executive Summary")
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Fleet Size", f"{fleet_size:,}")
-    c2.metric("Avg Age", f"{avg_age:.1f} years")
-    c3.metric("At Risk (>4yr)", f"{at_risk_pct:.0f}%")
     # Most enterprise devices are refurb eligible - calculate based on age
-    refurb_eligible_count = len(df[df["Age_Years"] >= 1]) if "Age_Years" in df.columns else fleet_size
+    refurb_eligible_count = int(np.count_nonzero(ages >= 1)) if ages is not None else fleet_size
     refurb_eligible_pct = (refurb_eligible_count / fleet_size * 100) if fleet_size > 0 else 100
-    c4.metric("Refurb Eligible", f"{refurb_eligible_pct:.0f}%")
+    render_metric_strip([
+        ("Fleet Size", f"{fleet_size:,}"),
+        ("Avg Age", f"{avg_age:.1f} years"),
+        ("At Risk (>4yr)", f"{at_risk_pct:.0f}%"),
+        ("Refurb Eligible", f"{refurb_eligible_pct:.0f}%"),
+    ])
     
     st.markdown("### Key Insights")
     # Calculate using proper formula: at_risk * productivity_cost_per_device
@@ -1728,7 +1818,7 @@ def _render_basic_upload_summary(df):
     annual_replacements = fleet_size / refresh_cycle
     savings_potential = annual_replacements * target_refurb_rate * price_delta
     
-    st.markdown(f'''
+    st.html(f'''
     <div class="insight-grid">
         <div class="insight-card">
             <div class="insight-title">FLEET AGE ABOVE BENCHMARK</div>
@@ -1741,7 +1831,7 @@ def _render_basic_upload_summary(df):
             <div class="insight-value">€{savings_potential:,.0f}/year potential</div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    ''')
     
     st.success("Confidence upgraded: **MEDIUM** → **HIGH** (based on uploaded data)")
 
@@ -1758,8 +1848,7 @@ def render_simulator():
     strategy = _s("selected_strategy")
     if not strategy:
         st.warning("No strategy selected. Please go back and select a strategy.")
-        if st.button("Back to Strategy", key=ui_key("simulator", "back_strat")):
-            safe_goto("strategy")
+        st.button("Back to Strategy", key=ui_key("simulator", "back_strat"), on_click=_goto, args=("strategy",))
         return
     
     # Strategy Summary
@@ -1767,7 +1856,7 @@ def render_simulator():
     refurb_rate = details.get("strategy", {}).get("refurb_rate", 0.4)
     time_text = fmt_time(strategy.time_to_target_months)
     
-    st.markdown(f'''
+    st.html(f'''
     <div class="strategy-summary">
         <div class="strategy-summary-title">Your Selected Strategy</div>
         <div class="strategy-summary-name">{strategy.strategy_name}</div>
@@ -1790,17 +1879,17 @@ def render_simulator():
             </div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    ''')
     
-    st.markdown(PART2_CSS, unsafe_allow_html=True)
+    st.html(PART2_CSS)
     
     # Device Simulator
-    st.markdown('''
+    st.html('''
     <div class="simulator-card">
         <div class="simulator-title">Device Simulator</div>
         <div class="simulator-subtitle">Test what decision makes sense for a specific device.</div>
     </div>
-    ''', unsafe_allow_html=True)
+    ''')
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -1838,25 +1927,23 @@ def render_simulator():
             reason = "Device is relatively new, no action needed"
             savings = 0
         
-        st.markdown(f'''
+        st.html(f'''
         <div class="simulator-result">
             <div class="simulator-result-title">Recommendation</div>
             <div class="simulator-result-value">{recommendation}</div>
             <div style="margin-top: 0.5rem; font-size: 0.85rem; color: var(--text-mid);">{reason}</div>
             {f'<div style="margin-top: 0.75rem; font-size: 1rem; color: var(--success);"><strong>Potential savings: €{savings}</strong></div>' if savings > 0 else ''}
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     
     st.markdown("---")
     
     # Navigation
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("Back", key=ui_key("simulator", "back")):
-            safe_goto("upload")
+        st.button("Back", key=ui_key("simulator", "back"), on_click=_goto, args=("upload",))
     with col2:
-        if st.button("Generate Action Plan", key=ui_key("simulator", "next"), use_container_width=True):
-            safe_goto("action")
+        st.button("Generate Action Plan", key=ui_key("simulator", "next"), use_container_width=True, on_click=_goto, args=("action",))
 
 
 # =============================================================================
@@ -1871,9 +1958,7 @@ def render_action():
     strategy = _s("selected_strategy")
     if not strategy:
         st.error("No strategy selected. Please start over.")
-        if st.button("Start Over", key=ui_key("action", "restart_err")):
-            _reset_state()
-            st.rerun()
+        st.button("Start Over", key=ui_key("action", "restart_err"), on_click=_reset_state)
         return
     
     df = _s("fleet_data")
@@ -1925,7 +2010,7 @@ def render_action():
     # =========================================================================
     # LUXURY EXECUTIVE DASHBOARD CSS
     # =========================================================================
-    st.markdown("""
+    st.html("""
     <style>
     /* Executive Dashboard Typography */
     .exec-dashboard {
@@ -2184,12 +2269,12 @@ def render_action():
         color: #2d5a2d;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """)
     
     # =========================================================================
     # EXECUTIVE SUMMARY - TOP KPIs
     # =========================================================================
-    st.markdown(f"""
+    st.html(f"""
     <div class="exec-dashboard">
         <div class="exec-kpi-container">
             <div class="exec-kpi">
@@ -2209,12 +2294,12 @@ def render_action():
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """)
     
     # =========================================================================
     # THE TRIPTYCH - Strategy Cards
     # =========================================================================
-    st.markdown('<div class="section-title">Strategic Pathways</div>', unsafe_allow_html=True)
+    st.html('<div class="section-title">Strategic Pathways</div>')
     
     # Get all strategies for triptych
     results_all = _s("all_strategies") or StrategySimulator.compare_all_strategies(
@@ -2254,7 +2339,7 @@ def render_action():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown(f'''
+        st.html(f'''
         <div class="triptych-card heritage">
             <div class="triptych-name">{conservative.strategy_name if conservative else "Conservative"}</div>
             <div class="triptych-subtitle">Heritage Approach</div>
@@ -2270,10 +2355,10 @@ def render_action():
                 </div>
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     
     with col2:
-        st.markdown(f'''
+        st.html(f'''
         <div class="triptych-card optimum">
             <div class="triptych-name">{optimum.strategy_name if optimum else "Balanced"}</div>
             <div class="triptych-subtitle">The Elysia Optimum</div>
@@ -2289,10 +2374,10 @@ def render_action():
                 </div>
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     
     with col3:
-        st.markdown(f'''
+        st.html(f'''
         <div class="triptych-card frontier">
             <div class="triptych-name">{ambitious.strategy_name if ambitious else "Ambitious"}</div>
             <div class="triptych-subtitle">Frontier Strategy</div>
@@ -2308,12 +2393,12 @@ def render_action():
                 </div>
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        ''')
     
     # =========================================================================
     # 90-DAY ROADMAP (Minimal)
     # =========================================================================
-    st.markdown('<div class="section-title">Implementation Roadmap</div>', unsafe_allow_html=True)
+    st.html('<div class="section-title">Implementation Roadmap</div>')
     
     # Build fleet profile for action plan
     fleet_profile = {
@@ -2339,7 +2424,7 @@ def render_action():
         )
         
         for phase in action_plan.phases:
-            st.markdown(f"""
+            st.html(f"""
             <div class="roadmap-phase">
                 <div class="roadmap-phase-header">
                     <div class="roadmap-phase-num">{phase.number}</div>
@@ -2348,7 +2433,7 @@ def render_action():
                 </div>
                 <div class="roadmap-milestone">✓ {phase.milestone}</div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
             
     except Exception:
         # Minimal fallback
@@ -2358,7 +2443,7 @@ def render_action():
             ("3", "Scale & Operationalize", "Days 61–90", "Policy fully operational"),
         ]
         for num, name, time, milestone in phases:
-            st.markdown(f"""
+            st.html(f"""
             <div class="roadmap-phase">
                 <div class="roadmap-phase-header">
                     <div class="roadmap-phase-num">{num}</div>
@@ -2367,15 +2452,15 @@ def render_action():
                 </div>
                 <div class="roadmap-milestone">✓ {milestone}</div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
     
     # =========================================================================
     # METHODOLOGY DROPDOWN - Clean text, no raw HTML classes
     # =========================================================================
     with st.expander(" ▼ Understanding the Strategic Logic"):
-        st.markdown("#### Financial Methodology")
-        
         st.markdown(f"""
+#### Financial Methodology
+
 **Price Delta Arbitrage**  
 The €{roi.annual_capex_avoidance_eur:,.0f} annual optimization derives from the price delta between new and certified refurbished devices. 
 Market analysis indicates refurbished enterprise hardware trades at 59% of new acquisition cost while delivering equivalent operational performance.
@@ -2391,20 +2476,13 @@ Refurbished procurement avoids 80% of these embodied emissions.
 **Return Multiple Calculation**  
 The {roi.return_multiple:.0f}x return multiple represents 5-year cumulative CAPEX avoidance (€{roi.five_year_capex_avoidance_eur:,.0f}) 
 divided by transition investment (€{roi.transition_cost_eur:,.0f} disposal and change management costs).
-        """)
-        
-        st.markdown("---")
-        st.markdown("#### Data Sources")
-        st.markdown("""
-- **Hardware Pricing**: Gartner IT Asset Management Report 2023
-- **Environmental Data**: GHG Protocol Scope 3, Dell Circular Economy Report 2023
-- **Grid Carbon Factors**: IEA 2023
-        """)
+
+{_STRATEGY_SOURCES_MD}""")
     
     # =========================================================================
     # METHODOLOGY & TRANSPARENCY TAB + DOWNLOADABLE PDF
     # =========================================================================
-    st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
+    st.html("<div style='height: 1rem;'></div>")
     
     # Tabs for methodology
     tab1, tab2 = st.tabs(["📊 Executive Summary", "📖 Full Methodology"])
@@ -2519,7 +2597,7 @@ Generated: {datetime.now().strftime('%Y-%m-%d')}
     # =========================================================================
     # EXPORT & NAVIGATION
     # =========================================================================
-    st.markdown("<div style='height: 2rem;'></div>", unsafe_allow_html=True)
+    st.html("<div style='height: 2rem;'></div>")
     
     col1, col2, col3 = st.columns([1, 1, 1])
     with col1:
@@ -2546,9 +2624,7 @@ Generated: {datetime.now().strftime('%Y-%m-%d')}
                           mime="text/markdown", use_container_width=True, key=ui_key("action", "download"))
     
     with col3:
-        if st.button("Start New Analysis", key=ui_key("action", "restart"), use_container_width=True):
-            _reset_state()
-            st.rerun()
+        st.button("Start New Analysis", key=ui_key("action", "restart"), use_container_width=True, on_click=_reset_state)
 
 
 # =============================================================================
@@ -2557,8 +2633,8 @@ Generated: {datetime.now().strftime('%Y-%m-%d')}
 
 def render_audit_section():
     """Main UI function - entry point for the audit."""
-    st.markdown(LUXURY_CSS, unsafe_allow_html=True)
-    st.markdown(PART2_CSS, unsafe_allow_html=True)
+    st.html(LUXURY_CSS)
+    st.html(PART2_CSS)
     inject_credibility_css()
     
     _get_audit_state()
@@ -2586,7 +2662,7 @@ def render_audit_section():
     render_func = stages.get(stage, render_welcome)
     render_func()
     
-    st.markdown('<div class="lux-footer"><div class="lux-footer-text">ÉLYSIA · LVMH GREEN IT · LIFE 360<br><span style="font-style:italic; font-size:0.7rem;">Where Insight Drives Impact</span></div></div>', unsafe_allow_html=True)
+    st.html('<div class="lux-footer"><div class="lux-footer-text">ÉLYSIA · LVMH GREEN IT · LIFE 360<br><span style="font-style:italic; font-size:0.7rem;">Where Insight Drives Impact</span></div></div>')
 
 
 def run():
@@ -2597,12 +2673,12 @@ def run():
 if __name__ == "__main__":
     try:
         st.set_page_config(page_title="Élysia", page_icon="✦", layout="wide", initial_sidebar_state="collapsed")
-    except:
+    except st.errors.StreamlitAPIException:
         pass
     run()
 
 # --- CSS INJECTION START ---
-st.markdown("""
+st.html("""
 <style>
     /* 1. MAKE THE STRATEGY BOX BIGGER */
     .strategy-summary {
@@ -2654,5 +2730,5 @@ st.markdown("""
         fill: #444 !important;
     }
 </style>
-""", unsafe_allow_html=True)
+""")
 # --- CSS INJECTION END ---
\ No newline at end of file
@@ -27,11 +27,14 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 import math
+import numpy as np
 import pandas as pd
 import io
 import math
 import random
+import sys
 
 
 
@@ -249,10 +252,31 @@ def _safe_float(x: Any, default: float = 0.0) -> float:
         return default
 
 
+def _coerce_ages(s: pd.Series) -> pd.Series:
+    """Float ages via a direct C-level cast; the per-element coerce path only for dirty columns."""
+    try:
+        return s.astype("float64")
+    except (ValueError, TypeError):
+        return pd.to_numeric(s, errors="coerce").astype("float64")
+
+
 def _avg_new_price() -> float:
     return _safe_float(AVERAGES.get("device_price_eur"), 1150.0)
 
 
+@lru_cache(maxsize=1)
+def _device_catalog() -> pd.DataFrame:
+    """DEVICES as a frame indexed by model name, built once for hashed joins against fleets."""
+    devices = DEVICES if isinstance(DEVICES, dict) else {}
+    return pd.DataFrame(
+        {
+            "refurb_available": [bool(m.get("refurb_available", False)) for m in devices.values()],
+            "price_new_eur": [_safe_float(m.get("price_new_eur"), math.nan) for m in devices.values()],
+        },
+        index=pd.Index(list(devices.keys()), name="Device_Model"),
+    )
+
+
 def _avg_mfg_co2_new() -> float:
     return _safe_float(AVERAGES.get("device_co2_manufacturing_kg"), 365.0)
 
@@ -682,13 +706,17 @@ class FleetAnalyzer:
     """Fleet evidence: profile + hotspots based on uploaded data."""
 
     REQUIRED_COLUMNS = ["Device_Model", "Age_Years"]
+    # Every column the analysis reads; anything else in an upload is dropped early.
+    ANALYSIS_COLUMNS = ["Device_Model", "Age_Years", "Persona", "Country"]
 
     @staticmethod
     def normalize_fleet_df(df: pd.DataFrame) -> pd.DataFrame:
         if df is None or not isinstance(df, pd.DataFrame) or df.empty:
             return pd.DataFrame(columns=FleetAnalyzer.REQUIRED_COLUMNS)
 
-        norm = df.copy()
+        # Shallow copy: every step below replaces whole columns, so the
+        # caller's frame is never written to and the data need not be duplicated.
+        norm = df.copy(deep=False)
         rename_map: Dict[str, str] = {}
         if "Model" in norm.columns and "Device_Model" not in norm.columns:
             rename_map["Model"] = "Device_Model"
@@ -696,20 +724,19 @@ class FleetAnalyzer:
             rename_map["Age"] = "Age_Years"
         if rename_map:
             norm = norm.rename(columns=rename_map)
+        norm = norm.drop(columns=[c for c in norm.columns if c not in FleetAnalyzer.ANALYSIS_COLUMNS])
 
         # Ensure required cols exist
         for c in FleetAnalyzer.REQUIRED_COLUMNS:
             if c not in norm.columns:
                 norm[c] = None
 
-        # Types
-        norm["Device_Model"] = norm["Device_Model"].astype(str)
-        norm["Age_Years"] = pd.to_numeric(norm["Age_Years"], errors="coerce")
-
-        if "Country" in norm.columns:
-            norm["Country"] = norm["Country"].astype(str)
-        if "Persona" in norm.columns:
-            norm["Persona"] = norm["Persona"].astype(str)
+        # Types: one cast + strip pass over the text columns, float64 ages
+        text_cols = [c for c in ("Device_Model", "Country", "Persona") if c in norm.columns]
+        norm[text_cols] = norm[text_cols].astype(str).apply(lambda col: col.str.strip())
+        # Few distinct models per fleet: integer codes make lookups and grouping cheap
+        norm["Device_Model"] = norm["Device_Model"].astype("category")
+        norm["Age_Years"] = _coerce_ages(norm["Age_Years"])
 
         norm = norm.dropna(subset=["Device_Model", "Age_Years"]).reset_index(drop=True)
         return norm
@@ -737,15 +764,13 @@ class FleetAnalyzer:
         age_high = _safe_float(URGENCY_CONFIG.get("age_high_years"), 4.0)
         age_risk_share = float((norm["Age_Years"] >= age_high).mean())
 
-        # Eligibility: based on known device catalog
-        eligible = 0
-        total_new_spend = 0.0
-        for _, row in norm.iterrows():
-            dev = str(row.get("Device_Model"))
-            meta = DEVICES.get(dev, {}) if isinstance(DEVICES, dict) else {}
-            if bool(meta.get("refurb_available", False)):
-                eligible += 1
-            total_new_spend += _safe_float(meta.get("price_new_eur"), _avg_new_price())
+        # Eligibility: based on known device catalog. Fleets repeat a handful of
+        # models, so look each distinct model up once and gather by code
+        # instead of joining row-wise (unknown models -> NaN -> defaults).
+        codes, models = pd.factorize(norm["Device_Model"])
+        meta = _device_catalog().reindex(models)
+        eligible = int(np.count_nonzero(meta["refurb_available"].fillna(False).astype(bool).to_numpy()[codes]))
+        total_new_spend = float(meta["price_new_eur"].fillna(_avg_new_price()).to_numpy()[codes].sum())
 
         eligible_share = float(eligible / fleet_size) if fleet_size else 0.0
 
@@ -773,7 +798,7 @@ class FleetAnalyzer:
         if norm.empty:
             return pd.DataFrame(columns=["Device_Model", "count", "avg_age"])
         agg = (
-            norm.groupby("Device_Model")
+            norm.groupby("Device_Model", observed=True)
             .agg(count=("Device_Model", "size"), avg_age=("Age_Years", "mean"))
             .sort_values(["count", "avg_age"], ascending=[False, False])
             .head(int(n))
@@ -1536,38 +1561,47 @@ class DeviceCategoryExtractor:
         if df is None or df.empty:
             return {}
         
-        categories: Dict[str, Dict] = {}
         total_devices = len(df)
         
-        for _, row in df.iterrows():
-            device_name = str(row.get("Device_Model", "Unknown"))
-            age = _safe_float(row.get("Age_Years", 3.0), 3.0)
-            
-            # Get category
-            category = DeviceCategoryExtractor.categorize_device(device_name)
-            
-            if category not in categories:
-                categories[category] = {
-                    "count": 0,
-                    "total_age": 0.0,
-                    "ages": [],
-                    "devices": [],
-                    "at_risk": 0,
-                    "refurb_eligible": 0,
-                }
-            
-            categories[category]["count"] += 1
-            categories[category]["total_age"] += age
-            categories[category]["ages"].append(age)
-            categories[category]["devices"].append(device_name)
-            
-            if age >= 4.0:
-                categories[category]["at_risk"] += 1
-            
-            # Check refurb eligibility
-            meta = DEVICES.get(device_name, {}) if DEVICES else {}
-            if meta.get("refurb_available", True):  # Default to True
-                categories[category]["refurb_eligible"] += 1
+        if "Device_Model" in df.columns:
+            names = df["Device_Model"].astype(str)
+        else:
+            names = pd.Series("Unknown", index=df.index)
+        if "Age_Years" in df.columns:
+            ages = pd.to_numeric(df["Age_Years"], errors="coerce").fillna(3.0)
+        else:
+            ages = pd.Series(3.0, index=df.index)
+        
+        # Categorize and look up refurb eligibility once per distinct model,
+        # then aggregate column-wise instead of walking the rows.
+        unique_names = names.unique()
+        category_of = {n: DeviceCategoryExtractor.categorize_device(n) for n in unique_names}
+        eligible_of = {
+            n: bool((DEVICES.get(n, {}) if DEVICES else {}).get("refurb_available", True))
+            for n in unique_names
+        }
+        
+        grouped = pd.DataFrame({
+            "category": names.map(category_of),
+            "age": ages,
+            "at_risk": ages >= 4.0,
+            "eligible": names.map(eligible_of),
+        }).groupby("category", sort=False).agg(
+            count=("age", "size"),
+            total_age=("age", "sum"),
+            at_risk=("at_risk", "sum"),
+            refurb_eligible=("eligible", "sum"),
+        )
+        
+        categories: Dict[str, Dict] = {
+            cat: {
+                "count": int(data["count"]),
+                "total_age": float(data["total_age"]),
+                "at_risk": int(data["at_risk"]),
+                "refurb_eligible": int(data["refurb_eligible"]),
+            }
+            for cat, data in grouped.to_dict("index").items()
+        }
         
         # Convert to CategoryInfo objects
         result: Dict[str, CategoryInfo] = {}
@@ -1672,7 +1706,7 @@ class FleetInsightsGenerator:
         warnings = []
         
         # Check and rename columns
-        df_clean = df.copy()
+        df_clean = df.copy(deep=False)  # columns are only ever replaced, never edited in place
         
         if "Device_Model" not in df_clean.columns:
             if "Model" in df_clean.columns:
@@ -1695,8 +1729,9 @@ class FleetInsightsGenerator:
                 warnings=["Required columns missing"]
             )
         
-        # Convert types
-        df_clean["Age_Years"] = pd.to_numeric(df_clean["Age_Years"], errors="coerce")
+        # Narrow to the analysed columns, then convert types
+        df_clean = df_clean.drop(columns=[c for c in df_clean.columns if c not in FleetAnalyzer.ANALYSIS_COLUMNS])
+        df_clean["Age_Years"] = _coerce_ages(df_clean["Age_Years"])
         
         # Handle Country
         if "Country" not in df_clean.columns:
@@ -1756,8 +1791,9 @@ class FleetInsightsGenerator:
         # Calculate summary
         fleet_size = len(df_clean)
         avg_age = float(df_clean["Age_Years"].mean())
-        age_risk_share = float((df_clean["Age_Years"] >= 4.0).mean())
-        devices_at_risk = int((df_clean["Age_Years"] >= 4.0).sum())
+        at_risk_mask = (df_clean["Age_Years"] >= 4.0).to_numpy()
+        devices_at_risk = int(at_risk_mask.sum())
+        age_risk_share = devices_at_risk / fleet_size if fleet_size > 0 else 0.0
         
         # Get categories
         categories = DeviceCategoryExtractor.extract_categories(df_clean)
@@ -1766,8 +1802,11 @@ class FleetInsightsGenerator:
         
         # Primary geography
         if "Country" in df_clean.columns:
-            primary_geo = df_clean["Country"].mode().iloc[0] if not df_clean["Country"].mode().empty else geo_code
-            geo_distribution = df_clean["Country"].value_counts(normalize=True).to_dict()
+            # One counting pass serves both the mode (ties -> smallest code, as
+            # Series.mode() did) and the distribution
+            geo_counts = df_clean["Country"].value_counts()
+            primary_geo = geo_counts.index[geo_counts.to_numpy() == geo_counts.iloc[0]].min() if not geo_counts.empty else geo_code
+            geo_distribution = (geo_counts / geo_counts.sum()).to_dict()
         else:
             primary_geo = geo_code
             geo_distribution = {geo_code: 1.0}
@@ -1784,6 +1823,9 @@ class FleetInsightsGenerator:
             "categories": {k: v.__dict__ for k, v in categories.items()},
         }
         
+        # Refurb savings follow the strategy the user actually selected
+        strategy_refurb_rate = RiskBasedSelector.get_refurb_rate(selected_strategy)
+
         # Generate insights WITH PROOFS
         insights = FleetInsightsGenerator._generate_insights_with_proofs(
             summary, baseline_estimates, geo_code,
@@ -2128,6 +2170,14 @@ class PolicyImpactCalculator:
         avg_price = _safe_float(AVERAGES.get("device_price_eur", 1150), 1150)
         avg_co2 = _safe_float(AVERAGES.get("device_co2_manufacturing_kg", 365), 365)
         
+        # Category and age columns are built once; each policy is then a
+        # single fused boolean mask instead of a per-row scan plus isin().
+        ages = fleet_df["Age_Years"]
+        models = fleet_df["Device_Model"].astype(str)
+        device_category = models.map(
+            {m: DeviceCategoryExtractor.categorize_device(m) for m in models.unique()}
+        )
+        
         for policy in policies:
             cat_name = policy.category
             action = policy.action
@@ -2135,26 +2185,21 @@ class PolicyImpactCalculator:
             
             # Find matching category
             if cat_name == "All" or cat_name == "All Devices":
-                affected = fleet_df[fleet_df["Age_Years"] >= threshold]
+                affected = ages >= threshold
+                count = int(affected.sum())
                 cat_info = CategoryInfo(
                     name="All Devices", count=len(fleet_df), pct_of_fleet=1.0,
-                    avg_age=float(fleet_df["Age_Years"].mean()), devices_at_risk=len(affected),
+                    avg_age=float(ages.mean()), devices_at_risk=count,
                     refurb_eligible=len(fleet_df), recommendation="", recommendation_reason="",
                     potential_savings_eur=0, potential_co2_reduction_kg=0
                 )
             elif cat_name in categories:
                 cat_info = categories[cat_name]
-                # Get devices in this category
-                cat_devices = [d for d in fleet_df["Device_Model"] 
-                              if DeviceCategoryExtractor.categorize_device(str(d)) == cat_name]
-                affected = fleet_df[
-                    (fleet_df["Device_Model"].isin(cat_devices)) & 
-                    (fleet_df["Age_Years"] >= threshold)
-                ]
+                affected = (device_category == cat_name) & (ages >= threshold)
+                count = int(affected.sum())
             else:
                 continue
             
-            count = len(affected)
             affected_devices += count
             
             if count == 0:
@@ -2642,10 +2687,8 @@ class SimpleROICalculator:
 # =============================================================================
 
 if __name__ == "__main__":
-    # Test with example user inputs
-    print("=" * 60)
-    print("SIMPLE ROI TEST - Based on User Inputs")
-    print("=" * 60)
+    # Test with example user inputs; the report is collected and written once
+    out = ["=" * 60, "SIMPLE ROI TEST - Based on User Inputs", "=" * 60]
     
     # Simulate user inputs from calibration
     user_fleet = 12500      # Medium fleet
@@ -2660,31 +2703,33 @@ if __name__ == "__main__":
         current_refurb_rate=user_current,
     )
     
-    print(f"\nUser Inputs:")
-    print(f"  Fleet: {user_fleet:,} devices")
-    print(f"  Refresh: {user_refresh}-year cycle")
-    print(f"  Current refurb: {user_current*100:.0f}%")
-    print(f"  Target refurb: {strategy_target*100:.0f}%")
+    out += [
+        "\nUser Inputs:",
+        f"  Fleet: {user_fleet:,} devices",
+        f"  Refresh: {user_refresh}-year cycle",
+        f"  Current refurb: {user_current*100:.0f}%",
+        f"  Target refurb: {strategy_target*100:.0f}%",
+    ]
     
-    print(f"\nResults:")
-    print(f"  Return Multiple: {roi.return_multiple}x")
-    print(f"  Annual Savings: €{roi.annual_savings_eur:,.0f}")
-    print(f"  5-Year Savings: €{roi.five_year_savings_eur:,.0f}")
-    print(f"  Transition Cost: €{roi.transition_cost_eur:,.0f}")
-    print(f"  Payback: {roi.payback_months} months")
+    out += [
+        "\nResults:",
+        f"  Return Multiple: {roi.return_multiple}x",
+        f"  Annual Savings: €{roi.annual_savings_eur:,.0f}",
+        f"  5-Year Savings: €{roi.five_year_savings_eur:,.0f}",
+        f"  Transition Cost: €{roi.transition_cost_eur:,.0f}",
+        f"  Payback: {roi.payback_months} months",
+    ]
     
-    print(f"\n  HEADLINE: {roi.headline}")
+    out.append(f"\n  HEADLINE: {roi.headline}")
     
-    print("\n" + "=" * 60)
-    print("CALCULATION PROOF:")
-    print("=" * 60)
+    out += ["\n" + "=" * 60, "CALCULATION PROOF:", "=" * 60]
     for section, data in roi.calculation.items():
-        print(f"\n{section}:")
+        out.append(f"\n{section}:")
         if isinstance(data, dict):
-            for k, v in data.items():
-                print(f"  {k}: {v}")
+            out.extend(f"  {k}: {v}" for k, v in data.items())
         elif isinstance(data, list):
-            for item in data:
-                print(f"  - {item}")
+            out.extend(f"  - {item}" for item in data)
         else:
-            print(f"  {data}")
\ No newline at end of file
+            out.append(f"  {data}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
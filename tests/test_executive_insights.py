@@ -0,0 +1,28 @@
+"""Executive insights for the equipment audit."""
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "equipement_audit"))
+
+from calculator import (  # noqa: E402
+    FleetInsightsGenerator,
+    RiskBasedSelector,
+    StrategySimulator,
+    generate_demo_fleet,
+)
+
+
+def test_refurb_insight_uses_selected_strategy_rate():
+    df = pd.DataFrame(generate_demo_fleet())
+    for strategy in StrategySimulator.compare_all_strategies(len(df), 4, 0.0):
+        result = FleetInsightsGenerator.generate_executive_insights(
+            df=df,
+            baseline_estimates={"fleet_size": len(df)},
+            selected_strategy=strategy,
+            refresh_cycle=4,
+        )
+        refurb = next(i for i in result.insights if i.title == "Refurbishment Opportunity")
+        rate = RiskBasedSelector.get_refurb_rate(strategy)
+        assert refurb.calculation.inputs["strategy_refurb_rate"] == f"{rate*100:.0f}%"
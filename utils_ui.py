@@ -4,32 +4,26 @@ Light Luxury Theme - Fully Centered with Framed Rectangles
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
 import os
-import base64
+import re
 
 # =============================================================================
-# GLOBAL STYLES - FULL CENTERING & LUXURY FRAMING
+# GLOBAL STYLES - REFINED VISUAL HIERARCHY & RHYTHM
 # =============================================================================
 
-import streamlit as st
-import os
-import base64
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
 
-# =============================================================================
-# GLOBAL STYLES - REFINED VISUAL HIERARCHY & RHYTHM
-# =============================================================================
 
-def inject_global_styles():
-    """Light luxury LVMH styling - Refined visual hierarchy and breathing room"""
-    st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;500;600;700&family=Cormorant+Garamond:wght@300;400;500;600&family=Montserrat:wght@300;400;500;600&display=swap');
-    
+# Minified once at import; every rerun re-sends this string, so keep it small.
+_GLOBAL_CSS = minify_css("""
     /* === BASE APP === */
     .stApp {
-        background: linear-gradient(160deg, #faf9f7 0%, #f5f3ef 50%, #faf9f7 100%);
+        background: #faf9f7;
     }
     
     #MainMenu {visibility: hidden;}
@@ -84,24 +78,29 @@ def inject_global_styles():
     }
 
     /* === FRAMING BOXES - REFINED BREATHING ROOM === */
-    .pillar-card, .action-card, .context-card, .insight-card, .data-input-section, .chart-container {
-        background: #ffffff !important;
-        border: 1px solid #e8e4dc !important;
-        border-radius: 12px !important;
-        padding: 32px !important; 
-        margin-bottom: 28px !important;
-        box-shadow: 0 4px 12px rgba(138, 108, 74, 0.04) !important;
-        display: flex !important;
-        flex-direction: column !important;
-        align-items: flex-start !important;
+    /* Shared frame; each card type keeps its own class for the overrides below.
+       Card containers carry no inline styles and nothing else targets them with
+       !important, so these rules and the per-card ones below win on source order
+       without it. */
+    .frame-card {
+        background: #ffffff;
+        border: 1px solid #e8e4dc;
+        border-radius: 12px;
+        padding: 32px; 
+        margin-bottom: 28px;
+        box-shadow: 0 4px 12px rgba(138, 108, 74, 0.04);
+        display: flex;
+        flex-direction: column;
+        align-items: flex-start;
+        contain: layout style;
     }
 
     /* Context Card specific styling */
     .context-card {
-        border-left: 6px solid #8a6c4a !important;
-        border-radius: 4px 12px 12px 4px !important;
-        padding: 28px 32px !important;
-        margin-bottom: 20px !important;
+        border-left: 6px solid #8a6c4a;
+        border-radius: 4px 12px 12px 4px;
+        padding: 28px 32px;
+        margin-bottom: 20px;
     }
 
     /* === KPI CARDS - REFINED SPACING === */
@@ -219,7 +218,9 @@ def inject_global_styles():
     }
 
     /* === BODY TEXT - REFINED LINE HEIGHT === */
-    p, span, div, label, li {
+    /* Scoped to app-authored text so Streamlit's own layout nodes are not
+       matched; :where() keeps the specificity of the bare element selectors. */
+    :where([data-testid="stMarkdownContainer"], [data-testid="stHtml"]) :is(p, span, div, label, li) {
         font-family: 'Montserrat', sans-serif !important;
         color: #4a4a4a !important;
         font-size: 1rem !important;
@@ -229,7 +230,7 @@ def inject_global_styles():
     /* Context text specific */
     .context-text {
         line-height: 1.7 !important;
-        margin-bottom: 0 !important;
+        margin-bottom: 0;
     }
 
     /* Section headers spacing - REFINED RHYTHM */
@@ -283,16 +284,29 @@ def inject_global_styles():
         gap: 24px !important;
     }
 
+    /* Static card rows (pillars, insights) rendered as one HTML grid */
+    .card-grid {
+        display: grid;
+        gap: 24px;
+        width: 100%;
+    }
+
+    @media (max-width: 640px) {
+        .card-grid {
+            grid-template-columns: 1fr !important;
+        }
+    }
+
     /* === LOGO SECTION - REFINED SPACING === */
     .logo-section {
-        padding: 28px 0 18px 0 !important;
-        margin-bottom: 42px !important;
+        padding: 28px 0 18px 0;
+        margin-bottom: 42px;
     }
 
     /* === WELCOME HERO - REFINED SPACING === */
     .welcome-hero {
-        margin-bottom: 52px !important;
-        padding: 0 20px !important;
+        margin-bottom: 52px;
+        padding: 0 20px;
     }
 
     .welcome-hero p {
@@ -302,17 +316,17 @@ def inject_global_styles():
 
     /* === PILLAR CARDS - REFINED INTERNAL SPACING === */
     .pillar-card {
-        min-height: 200px !important;
-        padding: 28px 22px !important;
-        display: flex !important;
-        flex-direction: column !important;
-        align-items: center !important;
-        justify-content: center !important;
-        text-align: center !important;
+        min-height: 200px;
+        padding: 28px 22px;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        justify-content: center;
+        text-align: center;
     }
 
     .pillar-card > div:first-child {
-        margin-bottom: 16px !important;
+        margin-bottom: 16px;
     }
 
     .pillar-card > div:nth-child(2) {
@@ -335,17 +349,17 @@ def inject_global_styles():
 
     /* === ACTION CARDS - REFINED INTERNAL SPACING === */
     .action-card {
-        min-height: 220px !important;
-        padding: 36px 28px !important;
-        display: flex !important;
-        flex-direction: column !important;
-        align-items: center !important;
-        justify-content: center !important;
-        text-align: center !important;
+        min-height: 220px;
+        padding: 36px 28px;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        justify-content: center;
+        text-align: center;
     }
 
     .action-card > div:first-child {
-        margin-bottom: 18px !important;
+        margin-bottom: 18px;
     }
 
     .action-card > div:nth-child(2) {
@@ -367,56 +381,121 @@ def inject_global_styles():
 
     /* === INSIGHT CARDS - REFINED DENSITY === */
     .insight-card {
-        padding: 24px 20px !important;
-        min-height: 140px !important;
+        padding: 24px 20px;
+        min-height: 140px;
     }
 
     .insight-card > div:first-child {
-        margin-bottom: 10px !important;
+        margin-bottom: 10px;
     }
 
     /* === GOLD DIVIDER - REFINED SPACING === */
     .gold-divider {
-        margin: 48px 0 !important;
+        margin: 48px 0;
     }
 
     /* === FOOTER - REFINED SPACING === */
     div:has(> p[style*="Élysia"]) {
-        padding: 32px 0 !important;
+        padding: 32px 0;
     }
-    </style>
-    """, unsafe_allow_html=True)
-    
-def render_logo():
-    """Render a significantly larger Elysia logo, centered and positioned high."""
-    logo_path = "logo.png/elysia_logo.png" 
-
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as f:
-            data = f.read()
-            encoded = base64.b64encode(data).decode()
-        
-        st.markdown(f"""
+
+    /* === FONT LINKS - RENDER NOTHING, SO TAKE NO GAP === */
+    /* Older releases in the requirements range use the element-container testid */
+    div[data-testid="stElementContainer"]:has(link[rel="preconnect"]),
+    div[data-testid="element-container"]:has(link[rel="preconnect"]) {
+        display: none;
+    }
+""")
+_GLOBAL_STYLE_TAG = f"<style>{_GLOBAL_CSS}</style>"
+
+# Linked rather than @import-ed from the stylesheet, so the font CSS is fetched
+# in parallel instead of after the <style> block parses.
+_FONTS_URL = (
+    "https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;500;600;700"
+    "&family=Cormorant+Garamond:wght@400;500;600&family=Montserrat:wght@400;500;600&display=swap"
+)
+_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    f'<link rel="stylesheet" href="{_FONTS_URL}">'
+)
+
+
+def inject_global_styles():
+    """Light luxury LVMH styling - Refined visual hierarchy and breathing room"""
+    # Emitted on every run on purpose: Streamlit drops elements a rerun does
+    # not re-send, so a once-per-session guard would strip the styles.
+    st.html(_GLOBAL_STYLE_TAG)
+    # st.html sanitizes <link> away; the markdown renderer keeps raw tags.
+    st.markdown(_FONT_LINKS, unsafe_allow_html=True)
+
+
+# static/ sits next to main.py, which is where Streamlit serves it from
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "elysia_logo.png")
+# URL of LOGO_PATH when server.enableStaticServing is on (.streamlit/config.toml)
+LOGO_URL = "app/static/elysia_logo.png"
+
+
+@st.cache_data(show_spinner=False)
+def _logo_data_uri(path):
+    """Read and base64-encode the logo once per process; None when the file is missing."""
+    # Only needed when static serving is off, so not imported with the module.
+    import base64
+    import mmap
+
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return "data:image/png;base64,"
+        # b64encode reads the mapping through the buffer protocol, so the
+        # file is never copied into an intermediate bytes object.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return "data:image/png;base64," + base64.b64encode(mm).decode("ascii")
+
+
+def logo_src(path=LOGO_PATH):
+    """Image source for the logo: the static URL, which the browser can cache, else a data URI."""
+    if not os.path.exists(path):
+        return None
+    if st.get_option("server.enableStaticServing"):
+        return LOGO_URL
+    return _logo_data_uri(path)
+
+
+@st.cache_resource(show_spinner=False)
+def _logo_html():
+    """Logo block markup, falling back to the ELYSIA wordmark when the image is missing.
+
+    Built once per process, so reruns make no filesystem calls or string formatting for the logo.
+    """
+    uri = logo_src()
+
+    if uri is not None:
+        return f"""
         <div class="logo-section" style="display: flex; flex-direction: column; align-items: center; justify-content: center; padding: 28px 0 18px 0; border-bottom: 1px solid #e8e4dc; margin-bottom: 42px; background: white;">
-            <img src="data:image/png;base64,{encoded}" alt="Elysia Logo" style="width: 500px; max-width: 95%; margin-bottom: 8px; display: block; margin: 0 auto;">
+            <img src="{uri}" alt="Elysia Logo" style="width: 500px; max-width: 95%; margin-bottom: 8px; display: block; margin: 0 auto;">
             <div style="font-family: 'Montserrat', sans-serif; font-size: 0.8rem; letter-spacing: 5px; color: #8a6c4a; text-transform: uppercase; margin-top: 2px; text-align: center;">
                 Where insight drives impact
             </div>
         </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
+        """
+    return """
         <div class="logo-section" style="text-align: center; padding: 28px 0 18px 0; border-bottom: 1px solid #e8e4dc; margin-bottom: 42px; background: white;">
             <div style="font-family: 'Playfair Display', serif; font-size: 90px; color: #8a6c4a; letter-spacing: 15px; line-height: 1; text-align: center;">ELYSIA</div>
             <div style="font-family: 'Montserrat', sans-serif; font-size: 0.8rem; letter-spacing: 5px; color: #8a6c4a; text-transform: uppercase; margin-top: 12px; text-align: center;">
                 Where insight drives impact
             </div>
         </div>
-        """, unsafe_allow_html=True)
-        
-def render_welcome_section():
-    """Centered Hero section."""
-    st.markdown(f"""
+        """
+
+# Repeated section chrome, shared by the section constants below
+_GOLD_DIVIDER = '<div class="gold-divider" style="height:1px; background:linear-gradient(90deg,transparent,#d4cfc5,transparent); margin:48px 0;"></div>'
+
+def _section_header(title):
+    return f'<div class="section-header"><h2 class="section-title">{title}</h2></div>'
+
+_WELCOME_HTML = """
     <div class="welcome-hero" style="text-align: center; margin-bottom: 52px; padding: 0 20px;">
         <h1 style="font-size: 3.2rem !important; margin-bottom: 18px !important; line-height: 1.2 !important; text-align: center;">Welcome to Élysia</h1>
         <p style="text-align: center; margin: 12px auto 0; max-width: 850px; font-family: 'Cormorant Garamond', serif; font-size: 1.4rem; color: #6a6a6a; line-height: 1.68;">
@@ -424,18 +503,12 @@ def render_welcome_section():
             the environmental impact of LVMH's IT infrastructure across all Maisons.
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-def render_context_section():
-    """Render program context narrative."""
-    st.markdown("""
-    <div class="section-header">
-        <h2 class="section-title">Program Context</h2>
-    </div>
-    """, unsafe_allow_html=True)
+_CONTEXT_HTML = f"""
+    {_section_header("Program Context")}
     
-    st.markdown("""
-    <div class="context-card">
+    <div class="context-card frame-card">
         <div class="context-title">LIFE 360 Program</div>
         <p class="context-text">
             An alliance of Nature and Creativity. LVMH's LIFE 360 program sets ambitious 
@@ -444,127 +517,119 @@ def render_context_section():
         </p>
     </div>
     
-    <div class="context-card">
+    <div class="context-card frame-card">
         <div class="context-title">Our Commitment</div>
         <p class="context-text">
             We are dedicated to reducing LVMH's IT environmental footprint 
             by embedding sustainability into our technological framework.
         </p>
     </div>
-    """, unsafe_allow_html=True)
-
-def render_pillars_section():
-    """Render strategic pillars."""
-    st.markdown("""
-    <div class="section-header">
-        <h2 class="section-title">Strategic Pillars</h2>
+    """
+
+# Static homepage content, defined once rather than rebuilt on every rerun
+_PILLARS = (
+    ("🔄", "Harmonize", "Unify initiatives across Maisons"),
+    ("📊", "Define & Monitor", "Track KPIs at Group level"),
+    ("🎛", "Master", "Control environmental impact"),
+    ("🚀", "Develop", "Build sustainable IT strategy"),
+)
+
+_INSIGHTS = (
+    ("🔋 High Impact", "The impact is not only environmental but also Financial"),
+    ("⏰ Lifecycle", "Devices' lifecycle could be extended, saving money and carbon"),
+    ("☁️ Cloud", "Archiving could cut cloud carbon by 90%"),
+)
+
+# The sections never change, so their markup is formatted once at import
+_PILLAR_CARDS = "".join(f"""
+        <div class="pillar-card frame-card">
+            <div style="font-size:1.8rem; margin-bottom:16px; color:#8a6c4a;">{icon}</div>
+            <div style="font-weight:600; font-size:0.75rem; text-transform:uppercase; letter-spacing:1.5px; margin-bottom:10px;">{title}</div>
+            <p style="color:#777; font-size:0.95rem; line-height:1.6;">{desc}</p>
+        </div>""" for icon, title, desc in _PILLARS)
+
+_PILLARS_HTML = f"""
+    {_section_header("Strategic Pillars")}
+    <div class="card-grid" style="grid-template-columns: repeat(4, 1fr);">{_PILLAR_CARDS}
     </div>
-    """, unsafe_allow_html=True)
-    
-    p1, p2, p3, p4 = st.columns(4)
-    pillars = [
-        ("🔄", "Harmonize", "Unify initiatives across Maisons"),
-        ("📊", "Define & Monitor", "Track KPIs at Group level"),
-        ("🎛", "Master", "Control environmental impact"),
-        ("🚀", "Develop", "Build sustainable IT strategy")
-    ]
-    
-    for col, (icon, title, desc) in zip([p1, p2, p3, p4], pillars):
-        with col:
-            st.markdown(f"""
-            <div class="pillar-card">
-                <div style="font-size:1.8rem; margin-bottom:16px; color:#8a6c4a;">{icon}</div>
-                <div style="font-weight:600; font-size:0.75rem; text-transform:uppercase; letter-spacing:1.5px; margin-bottom:10px;">{title}</div>
-                <p style="color:#777; font-size:0.95rem; line-height:1.6;">{desc}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-def render_navigation_section():
-    """Render navigation cards."""
-    st.markdown('<div class="gold-divider" style="height:1px; background:linear-gradient(90deg,transparent,#d4cfc5,transparent); margin:48px 0;"></div>', unsafe_allow_html=True)
-    st.markdown("""
-    <div class="section-header">
-        <h2 class="section-title">Tools</h2>
+    """
+
+_INSIGHT_CARDS = "".join(f"""
+        <div class="insight-card frame-card">
+            <div style="color:#2e7d32; font-weight:600; font-size:0.7rem; text-transform:uppercase; letter-spacing:1px; margin-bottom:10px;">{title}</div>
+            <p style="font-size:1rem; line-height:1.6;">{text}</p>
+        </div>""" for title, text in _INSIGHTS)
+
+_INSIGHTS_HTML = f"""
+    {_section_header("Strategic Insights")}
+    <div class="card-grid" style="grid-template-columns: repeat(3, 1fr);">{_INSIGHT_CARDS}
     </div>
-    """, unsafe_allow_html=True)
-    
-    nav1, nav2 = st.columns(2)
-    with nav1:
-        st.markdown("""
-        <div class="action-card">
-            <div style="font-size:2.5rem; margin-bottom:18px; color:#8a6c4a;">🖥</div>
-            <div style="font-family:'Playfair Display'; font-size:1.5rem; margin-bottom:14px;">Equipment Audit</div>
-            <p style="color:#777; font-size:1.05rem; line-height:1.6;">Analyze device lifecycle and get ROI recommendations</p>
+    """
+
+_NAV_HEADER_HTML = f"""
+    {_GOLD_DIVIDER}
+    {_section_header("Tools")}
+    """
+
+# (icon, title, description, button label, button key, page key)
+_TOOLS = (
+    ("🖥", "Equipment Audit", "Analyze device lifecycle and get ROI recommendations",
+     "Launch Equipment Audit", "nav_eq", "equipment"),
+    ("☁", "Cloud Optimizer", "Optimize storage and plan archival strategies",
+     "Launch Cloud Optimizer", "nav_cl", "cloud"),
+)
+
+_TOOL_CARDS_HTML = tuple(f"""
+        <div class="action-card frame-card">
+            <div style="font-size:2.5rem; margin-bottom:18px; color:#8a6c4a;">{icon}</div>
+            <div style="font-family:'Playfair Display'; font-size:1.5rem; margin-bottom:14px;">{title}</div>
+            <p style="color:#777; font-size:1.05rem; line-height:1.6;">{desc}</p>
         </div>
-        """, unsafe_allow_html=True)
-        if st.button("Launch Equipment Audit", key="nav_eq", use_container_width=True):
-            st.session_state['page'] = 'equipment'
-            st.rerun()
-    
-    with nav2:
-        st.markdown("""
-        <div class="action-card">
-            <div style="font-size:2.5rem; margin-bottom:18px; color:#8a6c4a;">☁</div>
-            <div style="font-family:'Playfair Display'; font-size:1.5rem; margin-bottom:14px;">Cloud Optimizer</div>
-            <p style="color:#777; font-size:1.05rem; line-height:1.6;">Optimize storage and plan archival strategies</p>
-        </div>
-        """, unsafe_allow_html=True)
-        if st.button("Launch Cloud Optimizer", key="nav_cl", use_container_width=True):
-            st.session_state['page'] = 'cloud'
-            st.rerun()
-
-def render_insights_section():
-    """Render strategic insights."""
-    st.markdown("""
-    <div class="section-header">
-        <h2 class="section-title">Strategic Insights</h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    i1, i2, i3 = st.columns(3)
-    insights = [
-        ("🔋 High Impact", "The impact is not only environmental but also Financial"),
-        ("⏰ Lifecycle", "Devices' lifecycle could be extended, saving money and carbon"),
-        ("☁️ Cloud", "Archiving could cut cloud carbon by 90%")
-    ]
-    
-    for col, (title, text) in zip([i1, i2, i3], insights):
-        with col:
-            st.markdown(f"""
-            <div class="insight-card">
-                <div style="color:#2e7d32; font-weight:600; font-size:0.7rem; text-transform:uppercase; letter-spacing:1px; margin-bottom:10px;">{title}</div>
-                <p style="font-size:1rem; line-height:1.6;">{text}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        """ for icon, title, desc, *_ in _TOOLS)
 
-def render_footer():
-    """Render footer."""
-    st.markdown('<div class="gold-divider" style="height:1px; background:linear-gradient(90deg,transparent,#d4cfc5,transparent); margin:48px 0;"></div>', unsafe_allow_html=True)
-    st.markdown("""
+def _render_navigation_cards(pages):
+    """Card + launch button per tool; the buttons need real st.columns."""
+    for col, card_html, (*_, label, key, page) in zip(st.columns(len(_TOOLS)), _TOOL_CARDS_HTML, _TOOLS):
+        col.html(card_html)
+        if col.button(label, key=key, use_container_width=True):
+            st.switch_page(pages[page])
+
+_FOOTER_HTML = f"""
+    {_GOLD_DIVIDER}
     <div style="text-align: center; padding: 32px 0;">
         <p style="color: #aaa; font-size: 0.7rem; letter-spacing: 3px; text-transform: uppercase;">
             Élysia · Alberthon 2026 
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
 def render_urgent_alert(header_text, title_text, paragraph_text):
     """Specific function to render the Urgent Red Box with LEFT alignment."""
-    st.markdown(f"""
+    st.html(f"""
     <div class="urgent-alert">
         <div class="urgent-alert-header">🚨 {header_text}</div>
         <h3>{title_text}</h3>
         <p>{paragraph_text}</p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
+
+_HOME_BOTTOM_HTML = _INSIGHTS_HTML + _FOOTER_HTML
+
+
+@st.cache_resource(show_spinner=False)
+def _home_top_html():
+    """Everything above the tool buttons, concatenated once per process."""
+    return _logo_html() + _WELCOME_HTML + _CONTEXT_HTML + _PILLARS_HTML + _NAV_HEADER_HTML
+
+
+def show_home_page(pages):
+    """Main function rendering the narrative strategy homepage.
 
-def show_home_page():
-    """Main function rendering the narrative strategy homepage."""
+    pages maps the tool keys ('equipment', 'cloud') to their st.Page.
+    """
     inject_global_styles()
-    render_logo()
-    render_welcome_section()
-    render_context_section()
-    render_pillars_section()
-    render_navigation_section()
-    render_insights_section()
-    render_footer()
+    # Static markup around the tool buttons goes out as one element per side
+    # instead of one per section.
+    st.html(_home_top_html())
+    _render_navigation_cards(pages)
+    st.html(_HOME_BOTTOM_HTML)